@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict, Generic, Type, TypeVar
+from typing import Any, ClassVar, Dict, Generic, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, model_validator
+from typing_extensions import Self
 
 from dbt_semantic_interfaces.errors import ParsingException
 from dbt_semantic_interfaces.parsing.yaml_loader import (
@@ -21,7 +23,7 @@ class HashableBaseModel(BaseModel):
     """Extends BaseModel with a generic hash function."""
 
     def __hash__(self) -> int:  # noqa: D
-        return hash(json.dumps(self.model_dump_json(), sort_keys=True))
+        return hash(self.model_dump_json())
 
 
 class FrozenBaseModel(HashableBaseModel):
@@ -31,14 +33,56 @@ class FrozenBaseModel(HashableBaseModel):
 
     def to_pretty_json(self) -> str:
         """Convert to a pretty JSON representation."""
-        raw_json_str = self.model_dump_json()
-        json_obj = json.loads(raw_json_str)
-        return json.dumps(json_obj, indent=4)
+        return json.dumps(self.model_dump(mode="json"), indent=4)
 
     def __str__(self) -> str:  # noqa: D
         return self.__repr__()
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_property_names(model_class: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(
+        name
+        for klass in model_class.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, functools.cached_property)
+    )
+
+
+class ModelWithCachedProperties(BaseModel):
+    """Pydantic model object that allows memoizing derived values with `functools.cached_property`.
+
+    Cached values live in the instance `__dict__`. They are dropped whenever a field on the object is reassigned, when
+    the object is copied, or when `clear_cached_properties` is called.
+
+    Mutating a nested object in place (e.g., setting `is_partition` on a dimension that belongs to a semantic model)
+    does not reach the parent. Values cached on a parent are therefore only guaranteed to be current once parsing and
+    transformations have finished, and `PydanticSemanticManifestTransformer` clears them after applying its rules.
+    Code that edits nested objects in place after that must call `clear_cached_properties` on the parent. This
+    includes adding elements to, or removing them from, a list field in place; to avoid this, assign a new list to the
+    field instead.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: D
+        super().__setattr__(name, value)
+        self.clear_cached_properties()
+
+    def __copy__(self) -> Self:  # noqa: D
+        copied = super().__copy__()
+        copied.clear_cached_properties()
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Self:  # noqa: D
+        copied = super().__deepcopy__(memo)
+        copied.clear_cached_properties()
+        return copied
+
+    def clear_cached_properties(self) -> None:
+        """Drops all memoized values, so that they are recomputed from the current state on the next access."""
+        for name in _cached_property_names(type(self)):
+            self.__dict__.pop(name, None)
+
+
 class ModelWithMetadataParsing(BaseModel):
     """Pydantic model object with a root validator for converting ParsingContext into Metadata].
 
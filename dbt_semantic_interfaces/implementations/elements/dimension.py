@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 
 from dbt_semantic_interfaces.implementations.base import (
     HashableBaseModel,
+    ModelWithCachedProperties,
     ModelWithMetadataParsing,
 )
 from dbt_semantic_interfaces.implementations.metadata import PydanticMetadata
@@ -37,7 +39,7 @@ class PydanticDimensionTypeParams(HashableBaseModel):
     validity_params: Optional[PydanticDimensionValidityParams] = None
 
 
-class PydanticDimension(HashableBaseModel, ModelWithMetadataParsing):
+class PydanticDimension(HashableBaseModel, ModelWithCachedProperties, ModelWithMetadataParsing):
     """Describes a dimension."""
 
     name: str
@@ -49,7 +51,7 @@ class PydanticDimension(HashableBaseModel, ModelWithMetadataParsing):
     metadata: Optional[PydanticMetadata] = None
     label: Optional[str] = None
 
-    @property
+    @cached_property
     def reference(self) -> DimensionReference:  # noqa: D
         return DimensionReference(element_name=self.name)
 
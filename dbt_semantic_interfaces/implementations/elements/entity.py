@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 
 from dbt_semantic_interfaces.implementations.base import (
     HashableBaseModel,
+    ModelWithCachedProperties,
     ModelWithMetadataParsing,
 )
 from dbt_semantic_interfaces.implementations.metadata import PydanticMetadata
@@ -11,7 +13,7 @@ from dbt_semantic_interfaces.references import EntityReference
 from dbt_semantic_interfaces.type_enums import EntityType
 
 
-class PydanticEntity(HashableBaseModel, ModelWithMetadataParsing):
+class PydanticEntity(HashableBaseModel, ModelWithCachedProperties, ModelWithMetadataParsing):
     """Describes a entity."""
 
     name: str
@@ -22,7 +24,7 @@ class PydanticEntity(HashableBaseModel, ModelWithMetadataParsing):
     metadata: Optional[PydanticMetadata] = None
     label: Optional[str] = None
 
-    @property
+    @cached_property
     def reference(self) -> EntityReference:  # noqa: D
         return EntityReference(element_name=self.name)
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import List, Optional
 
 from dbt_semantic_interfaces.implementations.base import (
     HashableBaseModel,
+    ModelWithCachedProperties,
     ModelWithMetadataParsing,
 )
 from dbt_semantic_interfaces.implementations.metadata import PydanticMetadata
@@ -32,7 +34,7 @@ class PydanticMeasureAggregationParameters(HashableBaseModel):
     use_approximate_percentile: bool = False
 
 
-class PydanticMeasure(HashableBaseModel, ModelWithMetadataParsing):
+class PydanticMeasure(HashableBaseModel, ModelWithCachedProperties, ModelWithMetadataParsing):
     """Describes a measure."""
 
     name: str
@@ -46,6 +48,6 @@ class PydanticMeasure(HashableBaseModel, ModelWithMetadataParsing):
     agg_time_dimension: Optional[str] = None
     label: Optional[str] = None
 
-    @property
+    @cached_property
     def reference(self) -> MeasureReference:  # noqa: D
         return MeasureReference(element_name=self.name)
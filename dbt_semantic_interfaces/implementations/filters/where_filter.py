@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict, List, Tuple
 
 from pydantic import model_validator
@@ -19,6 +20,16 @@ from dbt_semantic_interfaces.parsing.where_filter.where_filter_parser import (
 from dbt_semantic_interfaces.pretty_print import pformat_big_objects
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_where_sql(where_sql_template: str) -> FilterCallParameterSets:
+    """Parses a where SQL template, memoizing the result since the same template often appears in many places.
+
+    This is safe because parsing has no side effects and FilterCallParameterSets is immutable. Templates that fail
+    to parse are not cached, so the exception is raised again on every access.
+    """
+    return WhereFilterParser.parse_call_parameter_sets(where_sql_template)
+
+
 class PydanticWhereFilter(PydanticCustomInputParser, HashableBaseModel):
     """Pydantic implementation of a WhereFilter.
 
@@ -47,7 +58,7 @@ class PydanticWhereFilter(PydanticCustomInputParser, HashableBaseModel):
 
     @property
     def call_parameter_sets(self) -> FilterCallParameterSets:  # noqa: D
-        return WhereFilterParser.parse_call_parameter_sets(self.where_sql_template)
+        return _parse_where_sql(self.where_sql_template)
 
 
 class PydanticWhereFilterIntersection(HashableBaseModel):
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from typing import List, Optional, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from pydantic import model_validator
 from typing_extensions import override
 
 from dbt_semantic_interfaces.implementations.base import (
+    FrozenBaseModel,
     HashableBaseModel,
+    ModelWithCachedProperties,
     ModelWithMetadataParsing,
+    PydanticParseableValueType,
 )
 from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimension
 from dbt_semantic_interfaces.implementations.elements.entity import PydanticEntity
@@ -27,7 +32,7 @@ from dbt_semantic_interfaces.references import (
 )
 
 
-class NodeRelation(HashableBaseModel):
+class NodeRelation(FrozenBaseModel):
     """Path object to where the data should be."""
 
     alias: str
@@ -35,23 +40,41 @@ class NodeRelation(HashableBaseModel):
     database: Optional[str] = None
     relation_name: str = ""
 
-    @model_validator(mode="after")
-    def __create_default_relation_name(self) -> "NodeRelation":
-        """Dynamically build the dot path for `relation_name`, if not specified."""
-        if not self.relation_name:
-            if self.database is not None:
-                self.relation_name = f"{self.database}.{self.schema_name}.{self.alias}"
-            else:
-                self.relation_name = f"{self.schema_name}.{self.alias}"
-        return self
+    @model_validator(mode="before")
+    @classmethod
+    def __create_default_relation_name(cls, values: PydanticParseableValueType) -> PydanticParseableValueType:
+        """Dynamically build the dot path for `relation_name`, if not specified.
+
+        This runs on the raw input since the model is frozen. Inputs with missing or invalid path fields are passed
+        through untouched so that field validation can report them.
+        """
+        if not isinstance(values, dict) or values.get("relation_name", "") != "":
+            return values
+
+        database, schema_name, alias = values.get("database"), values.get("schema_name"), values.get("alias")
+        if not isinstance(schema_name, str) or not isinstance(alias, str):
+            return values
+        if database is None:
+            return {**values, "relation_name": ".".join((schema_name, alias))}
+        if isinstance(database, str):
+            return {**values, "relation_name": ".".join((database, schema_name, alias))}
+        return values
 
     @staticmethod
-    def from_string(sql_str: str) -> NodeRelation:  # noqa: D
+    def from_string(sql_str: str) -> NodeRelation:
+        """Builds a NodeRelation from a dot path like `<schema>.<table>` or `<db>.<schema>.<table>`.
+
+        Every part produced by the split is a string, so validation is skipped via `model_construct`.
+        """
         sql_str_split = sql_str.split(".")
         if len(sql_str_split) == 2:
-            return NodeRelation(schema_name=sql_str_split[0], alias=sql_str_split[1])
+            schema_name, alias = sql_str_split
+            return NodeRelation.model_construct(schema_name=schema_name, alias=alias, relation_name=sql_str)
         elif len(sql_str_split) == 3:
-            return NodeRelation(database=sql_str_split[0], schema_name=sql_str_split[1], alias=sql_str_split[2])
+            database, schema_name, alias = sql_str_split
+            return NodeRelation.model_construct(
+                database=database, schema_name=schema_name, alias=alias, relation_name=sql_str
+            )
         raise RuntimeError(
             f"Invalid input for a SQL table, expected form '<schema>.<table>' or '<db>.<schema>.<table>' "
             f"but got: {sql_str}"
@@ -66,7 +89,19 @@ class PydanticSemanticModelDefaults(HashableBaseModel, ProtocolHint[SemanticMode
     agg_time_dimension: Optional[str] = None
 
 
-class PydanticSemanticModel(HashableBaseModel, ModelWithMetadataParsing, ProtocolHint[SemanticModel]):
+@dataclass(frozen=True)
+class _DimensionPartitioning:
+    """The dimensions in a semantic model grouped by their validity and partition settings."""
+
+    has_validity_dimensions: bool
+    validity_start_dimensions: Tuple[PydanticDimension, ...]
+    validity_end_dimensions: Tuple[PydanticDimension, ...]
+    partitions: Tuple[PydanticDimension, ...]
+
+
+class PydanticSemanticModel(
+    HashableBaseModel, ModelWithCachedProperties, ModelWithMetadataParsing, ProtocolHint[SemanticModel]
+):
     """Describes a semantic model."""
 
     @override
@@ -98,33 +133,55 @@ class PydanticSemanticModel(HashableBaseModel, ModelWithMetadataParsing, Protoco
     def measure_references(self) -> List[MeasureReference]:  # noqa: D
         return [i.reference for i in self.measures]
 
+    # Cached, so in-place edits to the dimensions require `clear_cached_properties` (see ModelWithCachedProperties).
+    @cached_property
+    def _dimension_partitioning(self) -> _DimensionPartitioning:
+        validity_start_dims: List[PydanticDimension] = []
+        validity_end_dims: List[PydanticDimension] = []
+        partitions: List[PydanticDimension] = []
+        has_validity_dimensions = False
+        for dim in self.dimensions:
+            # validity_params is itself a property, so only evaluate it once per dimension.
+            validity_params = dim.validity_params
+            if validity_params is not None:
+                has_validity_dimensions = True
+                if validity_params.is_start:
+                    validity_start_dims.append(dim)
+                if validity_params.is_end:
+                    validity_end_dims.append(dim)
+            if dim.is_partition:
+                partitions.append(dim)
+
+        return _DimensionPartitioning(
+            has_validity_dimensions=has_validity_dimensions,
+            validity_start_dimensions=tuple(validity_start_dims),
+            validity_end_dimensions=tuple(validity_end_dims),
+            partitions=tuple(partitions),
+        )
+
     @property
     def has_validity_dimensions(self) -> bool:  # noqa: D
-        return any([dim.validity_params is not None for dim in self.dimensions])
+        return self._dimension_partitioning.has_validity_dimensions
 
     @property
     def validity_start_dimension(self) -> Optional[PydanticDimension]:  # noqa: D
-        validity_start_dims = [dim for dim in self.dimensions if dim.validity_params and dim.validity_params.is_start]
-        if not validity_start_dims:
-            return None
+        validity_start_dims = self._dimension_partitioning.validity_start_dimensions
         assert (
-            len(validity_start_dims) == 1
+            len(validity_start_dims) <= 1
         ), "Found more than one validity start dimension. This should have been blocked in validation!"
-        return validity_start_dims[0]
+        return validity_start_dims[0] if validity_start_dims else None
 
     @property
     def validity_end_dimension(self) -> Optional[PydanticDimension]:  # noqa: D
-        validity_end_dims = [dim for dim in self.dimensions if dim.validity_params and dim.validity_params.is_end]
-        if not validity_end_dims:
-            return None
+        validity_end_dims = self._dimension_partitioning.validity_end_dimensions
         assert (
-            len(validity_end_dims) == 1
+            len(validity_end_dims) <= 1
         ), "Found more than one validity end dimension. This should have been blocked in validation!"
-        return validity_end_dims[0]
+        return validity_end_dims[0] if validity_end_dims else None
 
     @property
-    def partitions(self) -> List[PydanticDimension]:  # noqa: D
-        return [dim for dim in self.dimensions or [] if dim.is_partition]
+    def partitions(self) -> Sequence[PydanticDimension]:  # noqa: D
+        return self._dimension_partitioning.partitions
 
     @property
     def partition(self) -> Optional[PydanticDimension]:  # noqa: D
@@ -135,32 +192,59 @@ class PydanticSemanticModel(HashableBaseModel, ModelWithMetadataParsing, Protoco
             raise ValueError(f"too many partitions for semantic_model {self.name}")
         return partitions[0]
 
-    @property
+    @cached_property
     def reference(self) -> SemanticModelReference:  # noqa: D
         return SemanticModelReference(semantic_model_name=self.name)
 
-    def get_measure(self, measure_reference: MeasureReference) -> PydanticMeasure:  # noqa: D
-        for measure in self.measures:
-            if measure.reference == measure_reference:
-                return measure
+    # The element indexes iterate in reverse so that the first element with a given name wins, which keeps lookups
+    # deterministic for models that have not yet been checked for duplicate element names.
+    @cached_property
+    def _measure_index(self) -> Dict[MeasureReference, PydanticMeasure]:
+        return {measure.reference: measure for measure in reversed(self.measures)}
 
-        raise ValueError(
-            f"No dimension with name ({measure_reference.element_name}) in semantic_model with name ({self.name})"
-        )
+    @cached_property
+    def _dimension_index(self) -> Dict[LinkableElementReference, PydanticDimension]:
+        return {dim.reference: dim for dim in reversed(self.dimensions)}
 
-    def get_dimension(self, dimension_reference: LinkableElementReference) -> PydanticDimension:  # noqa: D
-        for dim in self.dimensions:
-            if dim.reference == dimension_reference:
-                return dim
+    @cached_property
+    def _entity_index(self) -> Dict[LinkableElementReference, PydanticEntity]:
+        return {entity.reference: entity for entity in reversed(self.entities)}
 
-        raise ValueError(f"No dimension with name ({dimension_reference}) in semantic_model with name ({self.name})")
+    def get_measure(self, measure_reference: MeasureReference) -> PydanticMeasure:  # noqa: D
+        measure = self._measure_index.get(measure_reference)
+        if measure is None or measure.reference != measure_reference:
+            # Elements can be renamed in place (e.g., by transformations), so rebuild the index before giving up.
+            del self._measure_index
+            measure = self._measure_index.get(measure_reference)
+        if measure is None:
+            raise ValueError(
+                f"No measure with name ({measure_reference.element_name}) in semantic_model with name ({self.name})"
+            )
+        return measure
+
+    def get_measures(self, measure_references: Iterable[MeasureReference]) -> List[PydanticMeasure]:
+        """Returns the measures for the given references, in order, resolving them against a single index build."""
+        return [self.get_measure(measure_reference) for measure_reference in measure_references]
 
-    def get_entity(self, entity_reference: LinkableElementReference) -> PydanticEntity:  # noqa: D
-        for entity in self.entities:
-            if entity.reference == entity_reference:
-                return entity
+    def get_dimension(self, dimension_reference: LinkableElementReference) -> PydanticDimension:  # noqa: D
+        dim = self._dimension_index.get(dimension_reference)
+        if dim is None or dim.reference != dimension_reference:
+            del self._dimension_index
+            dim = self._dimension_index.get(dimension_reference)
+        if dim is None:
+            raise ValueError(
+                f"No dimension with name ({dimension_reference}) in semantic_model with name ({self.name})"
+            )
+        return dim
 
-        raise ValueError(f"No entity with name ({entity_reference}) in semantic_model with name ({self.name})")
+    def get_entity(self, entity_reference: LinkableElementReference) -> PydanticEntity:  # noqa: D
+        entity = self._entity_index.get(entity_reference)
+        if entity is None or entity.reference != entity_reference:
+            del self._entity_index
+            entity = self._entity_index.get(entity_reference)
+        if entity is None:
+            raise ValueError(f"No entity with name ({entity_reference}) in semantic_model with name ({self.name})")
+        return entity
 
     def checked_agg_time_dimension_for_measure(  # noqa: D
         self, measure_reference: MeasureReference
@@ -176,6 +260,6 @@ class PydanticSemanticModel(HashableBaseModel, ModelWithMetadataParsing, Protoco
         )
         return TimeDimensionReference(element_name=agg_time_dimension_name)
 
-    @property
+    @cached_property
     def primary_entity_reference(self) -> Optional[EntityReference]:  # noqa: D
         return EntityReference(element_name=self.primary_entity) if self.primary_entity is not None else None
@@ -64,4 +64,8 @@ class PydanticSemanticManifestTransformer(ProtocolHint[SemanticManifestTransform
             for rule in rule_sequence:
                 model_copy = rule.transform_model(model_copy)
 
+        # Rules edit semantic model elements in place, which does not clear values cached on the semantic model.
+        for semantic_model in model_copy.semantic_models:
+            semantic_model.clear_cached_properties()
+
         return model_copy
@@ -1,5 +1,6 @@
+import itertools
 import logging
-from typing import Generic, List, Sequence
+from typing import Generic, Sequence
 
 from dbt_semantic_interfaces.protocols import SemanticManifestT, SemanticModel
 from dbt_semantic_interfaces.references import SemanticModelReference
@@ -32,16 +33,24 @@ class PrimaryEntityRule(SemanticManifestValidationRule[SemanticManifestT], Gener
     @staticmethod
     @validate_safely("Check that a semantic model has properly configured primary entities.")
     def _check_model(semantic_model: SemanticModel) -> Sequence[ValidationIssue]:
+        primary_entity_reference = semantic_model.primary_entity_reference
+        entities_with_primary_type = tuple(
+            entity for entity in semantic_model.entities if entity.type is EntityType.PRIMARY
+        )
+
+        # Without primary typed entities, the only possible issue is a missing primary entity, so skip building the
+        # context for the (common) models that cannot produce an issue.
+        if len(entities_with_primary_type) == 0 and (
+            primary_entity_reference is not None or not PrimaryEntityRule._model_requires_primary_entity(semantic_model)
+        ):
+            return ()
+
         context = SemanticModelContext(
             file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
             semantic_model=SemanticModelReference(semantic_model_name=semantic_model.name),
         )
 
         # If there are entities defined in the model, check that there's only one primary entity.
-        entities_with_primary_type = tuple(
-            entity for entity in semantic_model.entities if entity.type is EntityType.PRIMARY
-        )
-
         if len(entities_with_primary_type) > 0:
             if len(entities_with_primary_type) > 1:
                 primary_entity_names = [primary_entity.name for primary_entity in entities_with_primary_type]
@@ -58,13 +67,13 @@ class PrimaryEntityRule(SemanticManifestValidationRule[SemanticManifestT], Gener
 
             entity_with_primary_type = entities_with_primary_type[0]
             # If there is a primary entity, the primary entity field should not be set.
-            if semantic_model.primary_entity_reference is not None:
+            if primary_entity_reference is not None:
                 return (
                     ValidationError(
                         message=(
                             f"The semantic model `{semantic_model.name}` has an entity named "
                             f"`{entity_with_primary_type.name}` with type primary but it also has the `primary_entity` "
-                            f"field set to `{semantic_model.primary_entity_reference.element_name}`. Both should not "
+                            f"field set to `{primary_entity_reference.element_name}`. Both should not "
                             f"be present in the model."
                         ),
                         context=context,
@@ -74,7 +83,7 @@ class PrimaryEntityRule(SemanticManifestValidationRule[SemanticManifestT], Gener
         # Check that a primary entity has been set if required.
         if (
             PrimaryEntityRule._model_requires_primary_entity(semantic_model)
-            and semantic_model.primary_entity_reference is None
+            and primary_entity_reference is None
             and len(entities_with_primary_type) == 0
         ):
             return (
@@ -93,8 +102,8 @@ class PrimaryEntityRule(SemanticManifestValidationRule[SemanticManifestT], Gener
     @staticmethod
     @validate_safely("Check that semantic models in the manifest have properly configured primary entities.")
     def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D
-        issues: List[ValidationIssue] = []
-        for semantic_model in semantic_manifest.semantic_models:
-            issues += PrimaryEntityRule._check_model(semantic_model)
-
-        return issues
+        return list(
+            itertools.chain.from_iterable(
+                PrimaryEntityRule._check_model(semantic_model) for semantic_model in semantic_manifest.semantic_models
+            )
+        )
@@ -102,7 +102,7 @@ class SemanticModelValidityWindowRule(SemanticManifestValidationRule[SemanticMan
         primary_or_unique_entities = [
             entity for entity in semantic_model.entities if entity.type in (EntityType.PRIMARY, EntityType.UNIQUE)
         ]
-        if not any([entity.type is EntityType.NATURAL for entity in semantic_model.entities]):
+        if not any(entity.type is EntityType.NATURAL for entity in semantic_model.entities):
             error = ValidationError(
                 context=context,
                 message=(
@@ -0,0 +1,202 @@
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
+from dbt_semantic_interfaces.implementations.elements.dimension import (
+    PydanticDimension,
+    PydanticDimensionTypeParams,
+    PydanticDimensionValidityParams,
+)
+from dbt_semantic_interfaces.implementations.elements.entity import PydanticEntity
+from dbt_semantic_interfaces.implementations.elements.measure import PydanticMeasure
+from dbt_semantic_interfaces.implementations.semantic_model import (
+    NodeRelation,
+    PydanticSemanticModel,
+)
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    MeasureReference,
+    SemanticModelReference,
+)
+from dbt_semantic_interfaces.type_enums import (
+    AggregationType,
+    DimensionType,
+    EntityType,
+    TimeGranularity,
+)
+
+
+@pytest.fixture
+def semantic_model() -> PydanticSemanticModel:  # noqa: D
+    return PydanticSemanticModel(
+        name="bookings",
+        node_relation=NodeRelation(schema_name="some_schema", alias="bookings"),
+        entities=[PydanticEntity(name="booking", type=EntityType.PRIMARY)],
+        measures=[
+            PydanticMeasure(name="bookings", agg=AggregationType.SUM),
+            PydanticMeasure(name="booking_value", agg=AggregationType.SUM),
+        ],
+        dimensions=[PydanticDimension(name="is_instant", type=DimensionType.CATEGORICAL)],
+    )
+
+
+def test_element_lookups(semantic_model: PydanticSemanticModel) -> None:  # noqa: D
+    assert semantic_model.get_measure(MeasureReference(element_name="booking_value")).name == "booking_value"
+    assert semantic_model.get_dimension(DimensionReference(element_name="is_instant")).name == "is_instant"
+    assert semantic_model.get_entity(EntityReference(element_name="booking")).name == "booking"
+
+    assert [
+        measure.name
+        for measure in semantic_model.get_measures(
+            [MeasureReference(element_name="booking_value"), MeasureReference(element_name="bookings")]
+        )
+    ] == ["booking_value", "bookings"]
+
+    with pytest.raises(ValueError, match="No measure with name"):
+        semantic_model.get_measure(MeasureReference(element_name="listings"))
+    with pytest.raises(ValueError, match="No measure with name"):
+        semantic_model.get_measures(
+            [MeasureReference(element_name="bookings"), MeasureReference(element_name="listings")]
+        )
+    with pytest.raises(ValueError):
+        semantic_model.get_dimension(DimensionReference(element_name="listing"))
+    with pytest.raises(ValueError):
+        semantic_model.get_entity(EntityReference(element_name="listing"))
+
+
+def test_element_lookups_after_mutation(semantic_model: PydanticSemanticModel) -> None:
+    """Tests that lookups reflect elements that were changed after a previous lookup."""
+    semantic_model.get_measure(MeasureReference(element_name="bookings"))
+
+    # Renaming an element in place
+    semantic_model.measures[0].name = "renamed_bookings"
+    assert semantic_model.get_measure(MeasureReference(element_name="renamed_bookings")).name == "renamed_bookings"
+    with pytest.raises(ValueError):
+        semantic_model.get_measure(MeasureReference(element_name="bookings"))
+
+    # Reassigning the field
+    semantic_model.measures = [PydanticMeasure(name="listings", agg=AggregationType.SUM)]
+    assert semantic_model.get_measure(MeasureReference(element_name="listings")).name == "listings"
+    with pytest.raises(ValueError):
+        semantic_model.get_measure(MeasureReference(element_name="booking_value"))
+
+    # Adding an element to the list in place requires clearing the cached index
+    semantic_model.measures.append(PydanticMeasure(name="bookings", agg=AggregationType.SUM))
+    semantic_model.clear_cached_properties()
+    assert semantic_model.get_measure(MeasureReference(element_name="bookings")).name == "bookings"
+
+    # Removing an element from the list in place requires clearing the cached index
+    semantic_model.measures.pop()
+    semantic_model.clear_cached_properties()
+    with pytest.raises(ValueError):
+        semantic_model.get_measure(MeasureReference(element_name="bookings"))
+
+    # Copying and then mutating the copy
+    semantic_model_copy = deepcopy(semantic_model)
+    semantic_model_copy.measures[0].name = "copied_listings"
+    assert semantic_model_copy.get_measure(MeasureReference(element_name="copied_listings")).name == "copied_listings"
+    assert semantic_model.get_measure(MeasureReference(element_name="listings")).name == "listings"
+
+
+def test_dimension_partitioning(semantic_model: PydanticSemanticModel) -> None:  # noqa: D
+    assert not semantic_model.has_validity_dimensions
+    assert semantic_model.validity_start_dimension is None
+    assert semantic_model.validity_end_dimension is None
+    assert semantic_model.partition is None
+
+    semantic_model.dimensions = [
+        PydanticDimension(
+            name=f"window_{prefix}",
+            type=DimensionType.TIME,
+            is_partition=is_partition,
+            type_params=PydanticDimensionTypeParams(
+                time_granularity=TimeGranularity.DAY,
+                validity_params=PydanticDimensionValidityParams(is_start=prefix == "start", is_end=prefix == "end"),
+            ),
+        )
+        for prefix, is_partition in (("start", True), ("end", False))
+    ]
+
+    assert semantic_model.has_validity_dimensions
+    assert semantic_model.validity_start_dimension is semantic_model.dimensions[0]
+    assert semantic_model.validity_end_dimension is semantic_model.dimensions[1]
+    assert semantic_model.partitions == (semantic_model.dimensions[0],)
+    assert semantic_model.partition is semantic_model.dimensions[0]
+
+    # Nested objects edited in place are only picked up once the cached values are cleared
+    start_dimension, end_dimension = semantic_model.dimensions
+    start_dimension.is_partition = False
+    end_dimension.is_partition = True
+    assert end_dimension.type_params is not None
+    end_dimension.type_params.validity_params = None
+    semantic_model.clear_cached_properties()
+
+    assert semantic_model.has_validity_dimensions
+    assert semantic_model.validity_start_dimension is start_dimension
+    assert semantic_model.validity_end_dimension is None
+    assert semantic_model.partition is end_dimension
+
+
+def test_cached_references_follow_field_updates(semantic_model: PydanticSemanticModel) -> None:  # noqa: D
+    assert semantic_model.reference is semantic_model.reference
+    assert semantic_model.primary_entity_reference is None
+
+    semantic_model.name = "renamed_bookings"
+    semantic_model.primary_entity = "booking"
+    assert semantic_model.reference == SemanticModelReference(semantic_model_name="renamed_bookings")
+    assert semantic_model.primary_entity_reference == EntityReference(element_name="booking")
+
+
+def test_node_relation() -> None:  # noqa: D
+    assert NodeRelation(schema_name="some_schema", alias="bookings").relation_name == "some_schema.bookings"
+    assert (
+        NodeRelation(database="some_db", schema_name="some_schema", alias="bookings").relation_name
+        == "some_db.some_schema.bookings"
+    )
+    assert (
+        NodeRelation(
+            schema_name="some_schema", alias="bookings", relation_name='"some_schema"."bookings"'
+        ).relation_name
+        == '"some_schema"."bookings"'
+    )
+    for sql_str, validated_node_relation in (
+        ("some_schema.bookings", NodeRelation(schema_name="some_schema", alias="bookings")),
+        ("some_db.some_schema.bookings", NodeRelation(database="some_db", schema_name="some_schema", alias="bookings")),
+    ):
+        parsed_node_relation = NodeRelation.from_string(sql_str)
+        assert parsed_node_relation == validated_node_relation
+        assert parsed_node_relation.model_fields_set == validated_node_relation.model_fields_set
+        assert parsed_node_relation.model_dump(exclude_unset=True) == validated_node_relation.model_dump(
+            exclude_unset=True
+        )
+
+    node_relation = NodeRelation(schema_name="some_schema", alias="bookings")
+    assert hash(node_relation) == hash(NodeRelation.from_string("some_schema.bookings"))
+    with pytest.raises(ValidationError):
+        node_relation.alias = "listings"  # type: ignore[misc]
+    with pytest.raises(ValidationError):
+        NodeRelation(schema_name="some_schema")  # type: ignore[call-arg]
+    with pytest.raises(ValidationError):
+        NodeRelation(schema_name="some_schema", alias="bookings", relation_name=None)  # type: ignore[arg-type]
+
+
+def test_element_references(semantic_model: PydanticSemanticModel) -> None:  # noqa: D
+    assert semantic_model.entity_references == [EntityReference(element_name="booking")]
+    assert semantic_model.dimension_references == [DimensionReference(element_name="is_instant")]
+    assert semantic_model.measure_references == [
+        MeasureReference(element_name="bookings"),
+        MeasureReference(element_name="booking_value"),
+    ]
+
+    semantic_model.measures = [PydanticMeasure(name="listings", agg=AggregationType.SUM)]
+    assert semantic_model.measure_references == [MeasureReference(element_name="listings")]
+
+    # Renaming an element in place after the first read
+    semantic_model.measures[0].name = "renamed_listings"
+    assert semantic_model.measure_references == [MeasureReference(element_name="renamed_listings")]
+    semantic_model.entities[0].name = "renamed_booking"
+    assert semantic_model.entity_references == [EntityReference(element_name="renamed_booking")]
+    semantic_model.dimensions[0].name = "renamed_is_instant"
+    assert semantic_model.dimension_references == [DimensionReference(element_name="renamed_is_instant")]
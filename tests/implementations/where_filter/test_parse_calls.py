@@ -233,3 +233,16 @@ def test_time_dimension_without_granularity() -> None:  # noqa: D
         ),
         entity_call_parameter_sets=(),
     )
+
+
+def test_call_parameter_sets_reused_for_identical_templates() -> None:
+    """Tests that filters sharing a template share the parse result, and that parse errors are not cached."""
+    where_sql_template = "{{ Dimension('booking__is_instant') }} AND {{ Entity('listing') }} IS NOT NULL"
+    parse_result = PydanticWhereFilter(where_sql_template=where_sql_template).call_parameter_sets
+
+    assert PydanticWhereFilter(where_sql_template=where_sql_template).call_parameter_sets is parse_result
+
+    bad_entity_filter = PydanticWhereFilter(where_sql_template="{{ Entity('order_id__is_food_order' )}}")
+    for _ in range(2):
+        with pytest.raises(ParseWhereFilterException, match="Entity name is in an incorrect format"):
+            bad_entity_filter.call_parameter_sets
@@ -32,3 +32,29 @@ def test_can_configure_model_transform_rules(  # noqa: D
     rules = [SliceNamesRule()]
     transformed_model = PydanticSemanticManifestTransformer.transform(pre_model, ordered_rule_sequences=(rules,))
     assert all(len(x.name) == 3 for x in transformed_model.semantic_models)
+
+
+class PartitionAllDimensionsRule(SemanticManifestTransformRule):
+    """Reads the partitions of each semantic model, then marks every dimension as a partition in place.
+
+    NOTE: specifically for testing
+    """
+
+    @staticmethod
+    def transform_model(semantic_manifest: PydanticSemanticManifest) -> PydanticSemanticManifest:  # noqa: D
+        for semantic_model in semantic_manifest.semantic_models:
+            semantic_model.partitions
+            for dimension in semantic_model.dimensions:
+                dimension.is_partition = True
+        return semantic_manifest
+
+
+def test_cached_properties_are_current_after_transforms(  # noqa: D
+    simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest,
+) -> None:
+    rules = [PartitionAllDimensionsRule()]
+    transformed_model = PydanticSemanticManifestTransformer.transform(
+        simple_semantic_manifest__with_primary_transforms, ordered_rule_sequences=(rules,)
+    )
+    for semantic_model in transformed_model.semantic_models:
+        assert list(semantic_model.partitions) == list(semantic_model.dimensions)
@@ -5,6 +5,7 @@ from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
 from dbt_semantic_interfaces.test_utils import find_semantic_model_with
+from dbt_semantic_interfaces.type_enums import EntityType
 from dbt_semantic_interfaces.validations.primary_entity import PrimaryEntityRule
 from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
     SemanticManifestValidator,
@@ -42,3 +43,20 @@ def test_primary_entity_conflict(simple_semantic_manifest: PydanticSemanticManif
     errors = model_validator.validate_semantic_manifest(semantic_manifest_copy).errors
     assert len(errors) == 1
     assert errors[0].message.find("Both should not be present in the model.") != -1
+
+
+def test_multiple_primary_entities(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa:D
+    semantic_manifest_copy = deepcopy(simple_semantic_manifest)
+    listings_latest_model, _ = find_semantic_model_with(
+        semantic_manifest_copy,
+        lambda semantic_model: semantic_model.name == "listings_latest",
+    )
+
+    for entity in listings_latest_model.entities:
+        entity.type = EntityType.PRIMARY
+
+    model_validator = SemanticManifestValidator[PydanticSemanticManifest]([PrimaryEntityRule()])
+    errors = model_validator.validate_semantic_manifest(semantic_manifest_copy).errors
+    assert len(errors) == 1
+    assert errors[0].message.find("can have only one primary entity") != -1
+    assert errors[0].message.find("listing, user") != -1
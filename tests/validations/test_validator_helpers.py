@@ -1,3 +1,4 @@
+import json
 from datetime import date
 from typing import List
 
@@ -150,3 +151,11 @@ def test_validate_safely_handles_exceptions():  # noqa: D
     # We shouldn't get an unhandled exception from this
     validation_issues = checking_validate_safely()
     assert len(validation_issues) == 1
+
+
+def test_pretty_json_model_validation_results(list_of_issues: List[ValidationIssue]) -> None:  # noqa: D
+    model_validation_issues = SemanticManifestValidationResults.from_issues_sequence(list_of_issues)
+    pretty_json = model_validation_issues.to_pretty_json()
+
+    assert pretty_json == json.dumps(json.loads(model_validation_issues.model_dump_json()), indent=4)
+    assert SemanticManifestValidationResults.model_validate_json(pretty_json) == model_validation_issues